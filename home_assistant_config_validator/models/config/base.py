@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC
 from collections import defaultdict
 from functools import lru_cache
 from json import loads
 from logging import getLogger
-from re import escape, sub
-from typing import TYPE_CHECKING, ClassVar, Self
+from typing import TYPE_CHECKING, ClassVar, Final, Self
 
 from pydantic import BaseModel, ConfigDict
 from ruamel.yaml import YAML
@@ -21,6 +21,45 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+MULTIPLE_WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s{2,}")
+
+
+class _NonAlphanumericTable(dict[int, str]):
+    """`str.translate` table mapping non-alphanumeric characters to a replacement.
+
+    Entries are computed on first lookup, so only characters which are actually seen
+    are stored.
+    """
+
+    def __init__(self, ignore_chars: str, replace_with: str) -> None:
+        """Initialize an empty table for the given ignored characters and replacement."""
+        super().__init__()
+        self.ignore_chars = ignore_chars
+        self.replace_with = replace_with
+
+    def __missing__(self, key: int) -> str:
+        char = chr(key)
+
+        self[key] = value = (
+            char
+            if (char.isascii() and char.isalnum()) or char in self.ignore_chars
+            else self.replace_with
+        )
+
+        return value
+
+
+@lru_cache(maxsize=32)
+def _non_alphanumeric_table(ignore_chars: str, replace_with: str, /) -> _NonAlphanumericTable:
+    """Get the translation table for a given set of ignored characters and replacement."""
+    return _NonAlphanumericTable(ignore_chars, replace_with)
+
+
+@lru_cache(maxsize=8)
+def _repeated_pattern(replace_with: str, /) -> re.Pattern[str]:
+    """Compile the pattern for two or more consecutive `replace_with` strings."""
+    return re.compile(rf"{re.escape(replace_with)}{{2,}}")
+
 
 def replace_non_alphanumeric(
     string: str,
@@ -50,19 +89,17 @@ def replace_non_alphanumeric(
         ignore_chars = "".join(ignore_chars)
 
     # Replaces non-alphanumeric characters with `replace_with`
-    formatted = sub(rf"[^a-zA-Z0-9{escape(ignore_chars)}]", replace_with, escape(string))
+    formatted = re.escape(string).translate(
+        _non_alphanumeric_table(ignore_chars, replace_with),
+    )
 
     if replace_with:
         # Replaces double (or more) `replace_with` with a single `replace_with`
-        formatted = sub(
-            rf"{escape(replace_with)}{{2,}}",
-            replace_with,
-            formatted,
-        )
+        formatted = _repeated_pattern(replace_with).sub(replace_with, formatted)
 
     if replace_with != " ":
         # Replace double (or more) spaces with a single space
-        formatted = sub(r"\s{2,}", " ", formatted)
+        formatted = MULTIPLE_WHITESPACE_PATTERN.sub(" ", formatted)
 
     return formatted.casefold().strip(replace_with)
 
@@ -121,7 +158,11 @@ class Config(BaseModel, ABC):
                 "not found",
             )
 
-        return cls(package=package, **(package_config or {}))
+        instance = cls(package=package, **(package_config or {}))
+
+        cls.INSTANCES[cls.CONFIGURATION_TYPE][package] = instance
+
+        return instance
 
     @staticmethod
     @lru_cache
@@ -6,10 +6,10 @@ import re
 from collections import defaultdict
 from contextlib import suppress
 from enum import StrEnum, auto
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from logging import getLogger
 from pathlib import Path  # noqa: TCH003
-from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Final, Literal
 
 from jinja2 import Environment, TemplateError, meta
 from jinja2.defaults import (
@@ -20,7 +20,6 @@ from jinja2.defaults import (
 from jinja2.nodes import Call, Impossible, Node
 from jinja2.nodes import Template as TemplateNode
 from pydantic import BaseModel, ConfigDict, Field
-from wg_utilities.helpers.mixin.instance_cache import CacheIdNotFoundError
 from wg_utilities.helpers.processor import JProc
 
 from home_assistant_config_validator.models import Package
@@ -70,6 +69,17 @@ class ShouldMatchFilepathItem(BaseModel):
 
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="forbid")
 
+    @cached_property
+    def normalisation_ignore_chars(self) -> str:
+        """Characters to keep when normalising an actual value for comparison."""
+        if self.case == Case.KEBAB:
+            return f"{self.separator}-"
+
+        if self.case == Case.SNAKE:
+            return f"{self.separator}_"
+
+        return self.separator
+
     def get_expected_value(self, file: Path, /, package: Package) -> str:
         """Get the expected formatted filepath value for the given file."""
         if self.remove_package_path is True:
@@ -185,32 +195,45 @@ def _inner(_value_: Call, entity_ids: set[str]) -> None:
             continue
 
 
-def get_consumed_entity_ids(template: TemplateNode) -> set[str]:
-    """Get a list of IDs of the entities consumed by the template."""
-    try:
-        jproc = JProc.from_cache("jinja_template_consumed_entities")
-    except CacheIdNotFoundError:
-        jproc = JProc(
-            {
-                Call: JProc.cb(
-                    _inner,
-                    item_filter=lambda item, **_: getattr(item.node, "name", None)
-                    in const.JINJA_ENTITY_CONSUMERS,
-                ),
-            },
-            identifier="jinja_template_consumed_entities",
-        )
-        jproc.processable_types = (Node,)
+CONSUMED_ENTITIES_JPROC: Final[JProc] = JProc(
+    {
+        Call: JProc.cb(
+            _inner,
+            item_filter=lambda item, **_: getattr(item.node, "name", None)
+            in const.JINJA_ENTITY_CONSUMERS,
+        ),
+    },
+    identifier="jinja_template_consumed_entities",
+)
+CONSUMED_ENTITIES_JPROC.processable_types = (Node,)
+CONSUMED_ENTITIES_JPROC.register_custom_getter(Node, lambda _, loc: loc)
+CONSUMED_ENTITIES_JPROC.register_custom_iterator(Node, lambda node: node.iter_child_nodes())
 
-        jproc.register_custom_getter(Node, lambda _, loc: loc)
-        jproc.register_custom_iterator(Node, lambda node: node.iter_child_nodes())
 
+def get_consumed_entity_ids(template: TemplateNode) -> set[str]:
+    """Get a list of IDs of the entities consumed by the template."""
     entity_ids: set[str] = set()
-    jproc.process_anything(template, entity_ids=entity_ids)
+    CONSUMED_ENTITIES_JPROC.process_anything(template, entity_ids=entity_ids)
 
     return entity_ids
 
 
+TEMPLATE_VARIABLES_JPROC: Final[JProc] = JProc(
+    {
+        dict: JProc.cb(
+            _remove_declared_variables,
+            lambda _, loc: loc == "variables",
+        ),
+        str: JProc.cb(
+            _remove_response_variables,
+            lambda _, loc: loc == "response_variable",
+        ),
+    },
+    identifier="find_template_variables",
+    process_pydantic_extra_fields=True,
+)
+
+
 @JProc.callback(allow_mutation=False)
 def _jinja_template_validator(
     _value_: str,
@@ -238,26 +261,8 @@ def _jinja_template_validator(
     if not undeclared_variables:
         return
 
-    try:
-        jproc = JProc.from_cache("find_template_variables")
-    except CacheIdNotFoundError:
-        jproc = JProc(
-            {
-                dict: JProc.cb(
-                    _remove_declared_variables,
-                    lambda _, loc: loc == "variables",
-                ),
-                str: JProc.cb(
-                    _remove_response_variables,
-                    lambda _, loc: loc == "response_variable",
-                ),
-            },
-            identifier="find_template_variables",
-            process_pydantic_extra_fields=True,
-        )
-
     # Process the model to get variables (including response variables)
-    jproc.process_model(
+    TEMPLATE_VARIABLES_JPROC.process_model(
         entity,
         undeclared_variables=undeclared_variables,
     )
@@ -325,6 +330,32 @@ def _validate_script_consumption_inner(
         )
 
 
+TEMPLATE_VALIDATION_JPROC: Final[JProc] = JProc(
+    {
+        str: JProc.cb(
+            _jinja_template_validator,
+            lambda item, **_: (
+                VARIABLE_START_STRING in item
+                or BLOCK_START_STRING in item
+                or COMMENT_START_STRING in item
+            ),
+        ),
+    },
+    identifier="template_validation",
+    process_pydantic_extra_fields=True,
+)
+
+SCRIPT_CONSUMPTION_JPROC: Final[JProc] = JProc(
+    {
+        dict: JProc.cb(
+            _validate_script_consumption_inner,
+            item_filter=lambda item, **_: item.get("service", "").split(".")[0] == "script",
+        ),
+    },
+    identifier="script_consumption",
+)
+
+
 class ValidationRule(StrEnum):
     """Enum for the different validation rules."""
 
@@ -366,7 +397,7 @@ class ValidationConfig(Config):
     GLOBAL_CONFIG: ClassVar[GlobalConfig]
     GLOBAL_CONFIG_CLASS: ClassVar[type[GlobalConfig]] = GlobalConfig
 
-    KNOWN_ENTITY_IDS: ClassVar[set[str]]
+    KNOWN_ENTITY_IDS: ClassVar[frozenset[str]]
 
     JINJA_ENV: ClassVar[Environment] = Environment(
         autoescape=True,
@@ -408,36 +439,18 @@ class ValidationConfig(Config):
                 ValidationConfig.JINJA_ENV.tests.setdefault(jt, lambda _: None)
 
             # This needs to be last - `KNOWN_ENTITY_IDS` is the flag for "this has been done"
-            ValidationConfig.KNOWN_ENTITY_IDS = {
+            ValidationConfig.KNOWN_ENTITY_IDS = frozenset(
                 DocumentationConfig.get_for_package(pkg).get_id(
                     entity,
                     prefix_domain=True,
                 )
                 for pkg in Package.get_packages()
                 for entity in pkg.entities
-            }
+            )
 
     def _validate_jinja2_templates(self, entity: Entity, /) -> None:
         """Validate that any Jinja2 Templates have valid syntax."""
-        try:
-            jproc = JProc.from_cache("template_validation")
-        except CacheIdNotFoundError:
-            jproc = JProc(
-                {
-                    str: JProc.cb(
-                        _jinja_template_validator,
-                        lambda item, **_: (
-                            VARIABLE_START_STRING in item
-                            or BLOCK_START_STRING in item
-                            or COMMENT_START_STRING in item
-                        ),
-                    ),
-                },
-                identifier="template_validation",
-                process_pydantic_extra_fields=True,
-            )
-
-        jproc.process_model(
+        TEMPLATE_VALIDATION_JPROC.process_model(
             entity,
             entity=entity,
             issues=self.issues[entity.file__],
@@ -452,10 +465,13 @@ class ValidationConfig(Config):
         ):
             return
 
+        validated_domains = self.GLOBAL_CONFIG.validate_domain_consumption
+        known_entity_ids = self.KNOWN_ENTITY_IDS
+
         for key, entity_id in entity.entity_dependencies | entity.jinja_consumed_entities__:
             if (
-                entity_id.split(".", 1)[0] in self.GLOBAL_CONFIG.validate_domain_consumption
-                and entity_id not in self.KNOWN_ENTITY_IDS
+                entity_id.partition(".")[0] in validated_domains
+                and entity_id not in known_entity_ids
                 and exc.InvalidEntityConsumedError.SUPPRESSION_COMMENT
                 not in entity.suppressions__.get(key, ())
             ):
@@ -467,26 +483,15 @@ class ValidationConfig(Config):
         if self.package.name not in {"automation", "script"}:
             return
 
-        try:
-            jproc = JProc.from_cache("script_consumption")
-        except CacheIdNotFoundError:
-            jproc = JProc(
-                {
-                    dict: JProc.cb(
-                        _validate_script_consumption_inner,
-                        item_filter=lambda item, **_: item.get("service", "").split(".")[0]
-                        == "script",
-                    ),
-                },
-                identifier="script_consumption",
-            )
-
         sequence_key = {
             "automation": "action",
             "script": "sequence",
         }[self.package.name]
 
-        jproc.process(entity.get(sequence_key, []), issues=self.issues[entity.file__])
+        SCRIPT_CONSUMPTION_JPROC.process(
+            entity.get(sequence_key, []),
+            issues=self.issues[entity.file__],
+        )
 
     def _validate_selector_is_required(self, script: Entity, /) -> None:
         for name, config in script.get("fields", {}).items():
@@ -594,19 +599,15 @@ class ValidationConfig(Config):
                 continue
 
     def _validate_should_match_filepath(self, entity_yaml: Entity, /) -> None:
-        if exc.ShouldMatchFilePathError.SUPPRESSION_COMMENT in entity_yaml.suppressions__.get(
-            "*",
-            (),
-        ):
+        suppressions = entity_yaml.suppressions__
+
+        if exc.ShouldMatchFilePathError.SUPPRESSION_COMMENT in suppressions.get("*", ()):
             return
 
         for json_path_str, config in self.should_match_filepath.items():
-            if (
-                exc.ShouldMatchFilePathError.SUPPRESSION_COMMENT
-                in entity_yaml.suppressions__.get(
-                    json_path_str.split(".")[-1],
-                    (),
-                )
+            if exc.ShouldMatchFilePathError.SUPPRESSION_COMMENT in suppressions.get(
+                json_path_str.split(".")[-1],
+                (),
             ):
                 continue
 
@@ -627,16 +628,9 @@ class ValidationConfig(Config):
                     ),
                 )
             else:
-                ignore_chars = [config.separator]
-
-                if config.case == Case.KEBAB:
-                    ignore_chars.append("-")
-                elif config.case == Case.SNAKE:
-                    ignore_chars.append("_")
-
                 normalised_value = replace_non_alphanumeric(
                     actual_value,
-                    ignore_chars=ignore_chars,
+                    ignore_chars=config.normalisation_ignore_chars,
                     replace_with="",
                 )
 
@@ -7,9 +7,8 @@ from dataclasses import dataclass
 from functools import cached_property
 from logging import getLogger
 from pathlib import Path, PurePath
-from typing import Any, ClassVar, Self
+from typing import Any, ClassVar, Final, Self
 
-from wg_utilities.helpers.mixin.instance_cache import CacheIdNotFoundError
 from wg_utilities.helpers.processor import JProc
 
 from home_assistant_config_validator.utils import (
@@ -38,6 +37,14 @@ def _get_entity_generators(
         tag_paths.append(_value_.absolute_path)
 
 
+ENTITY_GENERATORS_JPROC: Final[JProc] = JProc(
+    {TagWithPath: _get_entity_generators},
+    identifier="get_entity_generators",
+    process_type_changes=True,
+    process_pydantic_extra_fields=True,
+)
+
+
 @dataclass
 class Package:
     """A package of entities.
@@ -138,17 +145,7 @@ class Package:
         entity_generators: list[EntityGenerator] = []
         tag_paths: list[PurePath] = []
 
-        try:
-            jproc = JProc.from_cache("get_entity_generators")
-        except CacheIdNotFoundError:
-            jproc = JProc(
-                {TagWithPath: _get_entity_generators},
-                identifier="get_entity_generators",
-                process_type_changes=True,
-                process_pydantic_extra_fields=True,
-            )
-
-        jproc.process(
+        ENTITY_GENERATORS_JPROC.process(
             package_config,
             entity_generators=entity_generators,
             file=file,
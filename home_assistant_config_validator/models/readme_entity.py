@@ -28,6 +28,10 @@ class ReadmeEntity:
     package: Package
 
     MDI_ICON_PATTERN: Final[re.Pattern[str]] = re.compile(r"^mdi:(\w+-?)*\w+$")
+    ID_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(
+        r"(^|\s)ID(\s|$)",
+        flags=re.IGNORECASE,
+    )
 
     @staticmethod
     def __json_encoder(obj: object, /) -> str:
@@ -108,11 +112,9 @@ class ReadmeEntity:
     def fields(self) -> Generator[str, None, None]:
         """Generate the fields for the entity."""
         for field in self.docs_config.extra:
-            key = re.sub(
-                r"(^|\s)ID(\s|$)",
+            key = self.ID_WORD_PATTERN.sub(
                 r"\1ID\2",
                 field.split(".")[-1].replace("_", " ").title(),
-                flags=re.IGNORECASE,
             )
 
             if not (val := get_json_value(self.entity, field, default=None)):
@@ -31,45 +31,54 @@ ENTITY_ID_PATTERN: Final[re.Pattern[str]] = re.compile(
 )
 
 
-COMMON_SERVICES: Final[dict[str, set[str]]] = {
-    "decrement": {"input_number"},
-    "increment": {"input_number"},
-    "pause": {"media_player"},
-    "play": {"media_player"},
-    "reload": {"automation", "script", "scene", "group"},
-    "select_option": {"input_select"},
-    "set_datetime": {"input_datetime"},
-    "set_level": {"light", "cover"},
-    "set_options": {"input_select"},
-    "set": {"var"},
-    "set_value": {"input_number", "input_text"},
-    "start": {"script", "automation"},
-    "stop": {"script", "automation"},
-    "toggle": {"cover", "input_boolean", "light", "switch", "media_player"},
-    "turn_off": {
-        "automation",
-        "input_boolean",
-        "light",
-        "switch",
-        "media_player",
-        "cover",
-        "script",
-        "scene",
-        "group",
-    },
-    "turn_on": {
-        "automation",
-        "input_boolean",
-        "light",
-        "switch",
-        "media_player",
-        "cover",
-        "script",
-        "scene",
-        "group",
-    },
+COMMON_SERVICES: Final[dict[str, frozenset[str]]] = {
+    "decrement": frozenset({"input_number"}),
+    "increment": frozenset({"input_number"}),
+    "pause": frozenset({"media_player"}),
+    "play": frozenset({"media_player"}),
+    "reload": frozenset({"automation", "script", "scene", "group"}),
+    "select_option": frozenset({"input_select"}),
+    "set_datetime": frozenset({"input_datetime"}),
+    "set_level": frozenset({"light", "cover"}),
+    "set_options": frozenset({"input_select"}),
+    "set": frozenset({"var"}),
+    "set_value": frozenset({"input_number", "input_text"}),
+    "start": frozenset({"script", "automation"}),
+    "stop": frozenset({"script", "automation"}),
+    "toggle": frozenset({"cover", "input_boolean", "light", "switch", "media_player"}),
+    "turn_off": frozenset(
+        {
+            "automation",
+            "input_boolean",
+            "light",
+            "switch",
+            "media_player",
+            "cover",
+            "script",
+            "scene",
+            "group",
+        },
+    ),
+    "turn_on": frozenset(
+        {
+            "automation",
+            "input_boolean",
+            "light",
+            "switch",
+            "media_player",
+            "cover",
+            "script",
+            "scene",
+            "group",
+        },
+    ),
 }
 
+# Fully-qualified versions of the above, e.g. `light.turn_on`
+COMMON_SERVICE_IDS: Final[frozenset[str]] = frozenset(
+    f"{domain}.{service}" for service, domains in COMMON_SERVICES.items() for domain in domains
+)
+
 JINJA_ENTITY_CONSUMERS: Final[set[str]] = {
     "device_attr",
     "device_id",
@@ -183,6 +192,7 @@ INEQUAL = Inequal()
 
 __all__ = [
     "COMMON_SERVICES",
+    "COMMON_SERVICE_IDS",
     "ENTITIES_DIR",
     "INEQUAL",
     "JINJA_VARS",
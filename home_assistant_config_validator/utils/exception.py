@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Final
 
 from . import const
 
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
     from jinja2 import TemplateError
 
+WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s+")
+
 
 class ConfigurationError(Exception):
     """Raised when a configuration error is detected."""
@@ -144,9 +146,11 @@ class UnusedFileError(InvalidConfigurationError):
 
     def __init__(self, file: Path) -> None:
         """Initialize the error."""
-        super().__init__(f"File not used: {file.relative_to(const.REPO_PATH)}")
+        relative_path = file.relative_to(const.REPO_PATH)
+
+        super().__init__(f"File not used: {relative_path}")
 
-        self.fmt_msg = file.relative_to(const.REPO_PATH).as_posix()
+        self.fmt_msg = relative_path.as_posix()
 
 
 class NotFoundError(InvalidConfigurationError):
@@ -230,8 +234,8 @@ class ShouldBeEqualError(InvalidConfigurationError):
 
     def __init__(self, *, f1: str, f2: str, v1: Any, v2: Any) -> None:
         """Initialize the error."""
-        v1_str = re.sub(r"\s+", " ", str(v1)).strip()
-        v2_str = re.sub(r"\s+", " ", str(v2)).strip()
+        v1_str = WHITESPACE_PATTERN.sub(" ", str(v1)).strip()
+        v2_str = WHITESPACE_PATTERN.sub(" ", str(v2)).strip()
 
         super().__init__(f"{f1} `{v1_str}` should match {f2}: `{v2_str}`")
 
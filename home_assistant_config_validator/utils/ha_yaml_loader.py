@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import re
-import shutil
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Generator
 from contextlib import suppress
+from contextvars import ContextVar
+from copy import copy
 from dataclasses import dataclass, field
 from functools import cached_property, lru_cache
+from io import StringIO
 from logging import getLogger
 from pathlib import Path, PurePath
-from tempfile import NamedTemporaryFile
+from stat import S_ISDIR
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -27,13 +30,15 @@ from typing import (
     overload,
 )
 
-from jsonpath_ng import JSONPath, parse  # type: ignore[import-untyped]
+from jsonpath_ng import DatumInContext, JSONPath  # type: ignore[import-untyped]
 from jsonpath_ng.exceptions import JsonPathParserError  # type: ignore[import-untyped]
+from jsonpath_ng.parser import JsonPathParser  # type: ignore[import-untyped]
 from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
 from ruamel.yaml import YAML, ScalarNode
 from ruamel.yaml.comments import CommentedBase, CommentedMap, CommentedSeq
+from ruamel.yaml.constructor import SafeConstructor
+from ruamel.yaml.representer import SafeRepresenter
 from wg_utilities.functions import subclasses_recursive
-from wg_utilities.helpers.mixin.instance_cache import CacheIdNotFoundError
 from wg_utilities.helpers.processor import JProc
 
 from . import const
@@ -48,6 +53,8 @@ from .exception import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ruamel.yaml.representer import Representer
 
 LOGGER = getLogger(__name__)
@@ -69,6 +76,143 @@ HAYamlLoader.indent(mapping=2, sequence=4, offset=2)
 HAYamlLoader.width = 4096
 
 
+class _FastYamlConstructor(SafeConstructor):
+    """Safe constructor with its own registry of (custom tag) constructors."""
+
+
+class _FastYamlRepresenter(SafeRepresenter):
+    """Safe representer with its own registry of (custom tag) representers."""
+
+
+FastYamlLoader = YAML(typ="safe", pure=False)
+"""Loader for read-only use: no comments/quote preservation, but much faster."""
+
+# Registering a tag on a constructor/representer class registers it for every loader
+# using that class, so the custom tags would otherwise leak into unrelated safe loaders
+# (e.g. `Config.user_configuration`)
+FastYamlLoader.Constructor = _FastYamlConstructor
+FastYamlLoader.Representer = _FastYamlRepresenter
+
+LOADING_FILE: ContextVar[Path | None] = ContextVar("LOADING_FILE", default=None)
+"""The (resolved) file currently being loaded, attached to any tags constructed from it."""
+
+
+@lru_cache(maxsize=4096)
+def _resolve_path(path: Path, /) -> Path:
+    """Resolve a path; the file layout doesn't change during a run, so cache it."""
+    return path.resolve()
+
+
+@lru_cache(maxsize=256)
+def _pure_path(path: str, /) -> PurePath:
+    """Create a `PurePath`; the same relative paths recur throughout a configuration."""
+    return PurePath(path)
+
+
+def _with_file(content: JSONObj, file: Path, /) -> JSONObj:
+    """Add the (resolved) file which some content was loaded from to a copy of it.
+
+    `load_yaml` returns content which is shared between calls, so it can't be modified
+    in place. Only the top level is copied; comments are preserved.
+    """
+    content = copy(content)
+    content["file__"] = _resolve_path(file)
+
+    return content
+
+
+DirectoryFingerprint = tuple[tuple[Path, int], ...]
+"""The modification time of every directory walked for a listing."""
+
+_YAML_FILE_LISTINGS: dict[Path, tuple[DirectoryFingerprint, tuple[Path, ...]]] = {}
+
+
+def _list_yaml_files(
+    directory: Path,
+    mtime_ns: int,
+    /,
+) -> tuple[DirectoryFingerprint, tuple[Path, ...]]:
+    """List all YAML files in a directory (recursively), in a deterministic order.
+
+    Equivalent to `sorted(directory.rglob(const.GLOB_PATTERN))`, but uses `os.scandir`
+    directly so that each entry's type comes from the directory listing itself. The
+    modification time of each directory walked is returned alongside the listing.
+    """
+    fingerprint = [(directory, mtime_ns)]
+    yaml_files: list[Path] = []
+    stack = [os.fspath(directory)]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.endswith(const.EXT):
+                    yaml_files.append(Path(entry.path))
+
+                # Like `rglob`, don't recurse into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    fingerprint.append(
+                        (Path(entry.path), entry.stat(follow_symlinks=False).st_mtime_ns),
+                    )
+                    stack.append(entry.path)
+
+    yaml_files.sort()
+
+    return tuple(fingerprint), tuple(yaml_files)
+
+
+def _is_fingerprint_current(fingerprint: DirectoryFingerprint, /) -> bool:
+    """Check that none of the directories in a listing have changed since it was made."""
+    try:
+        return all(
+            dir_path.stat().st_mtime_ns == mtime_ns for dir_path, mtime_ns in fingerprint
+        )
+    except FileNotFoundError:
+        return False
+
+
+def get_yaml_files(directory: Path, /) -> tuple[Path, ...]:
+    """Get all YAML files in a directory (recursively), sorted by path.
+
+    Listings are cached, and only re-walked if any directory within them (not just the
+    top-level one) has been modified since.
+    """
+    cached = _YAML_FILE_LISTINGS.get(directory)
+
+    if cached is not None and _is_fingerprint_current(cached[0]):
+        return cached[1]
+
+    try:
+        dir_stat = directory.stat()
+
+        if not S_ISDIR(dir_stat.st_mode):
+            return ()
+
+        fingerprint, yaml_files = _list_yaml_files(directory, dir_stat.st_mtime_ns)
+    except FileNotFoundError:
+        _YAML_FILE_LISTINGS.pop(directory, None)
+        return ()
+
+    _YAML_FILE_LISTINGS[directory] = fingerprint, yaml_files
+
+    return yaml_files
+
+
+@lru_cache(maxsize=4096)
+def is_entity_id(value: str, /) -> bool:
+    """Return whether a string looks like an entity ID (and not a common service).
+
+    The same strings (e.g. entity IDs, service names) recur throughout a configuration,
+    so the result is cached.
+    """
+    # Cheap checks first: most strings aren't dotted at all, and service calls (e.g.
+    # `light.turn_on`) look like entity IDs
+    return (
+        "." in value
+        and value not in const.COMMON_SERVICE_IDS
+        and const.ENTITY_ID_PATTERN.fullmatch(value) is not None
+    )
+
+
 @JProc.callback(allow_mutation=False)
 def entity_id_check_callback(
     _value_: str,
@@ -77,11 +221,15 @@ def entity_id_check_callback(
     entity_ids: set[tuple[str, str]],
 ) -> None:
     """Identify entity IDs in strings."""
-    if matched := const.ENTITY_ID_PATTERN.fullmatch(_value_):
-        domain, id_ = matched.groups()
+    if is_entity_id(_value_):
+        entity_ids.add((str(_loc_ or "") if _obj_type_ is dict else "", _value_))
 
-        if not (id_ in const.COMMON_SERVICES and domain in const.COMMON_SERVICES[id_]):
-            entity_ids.add((str(_loc_ or "") if _obj_type_ is dict else "", _value_))
+
+ENTITY_ID_JPROC: Final[JProc] = JProc(
+    {str: entity_id_check_callback},
+    identifier="entity_id_check",
+    process_pydantic_extra_fields=True,
+)
 
 
 def parse_hacv_comment(cmt: str, /) -> dict[str, set[str]]:
@@ -106,7 +254,6 @@ class Entity(BaseModel):
     SUPPRESSION_COMMENT_PREFIX: ClassVar[str] = "# hacv disable: "
 
     file__: Path = Field(exclude=True)
-    modified__: bool = Field(default=False, exclude=True)
     suppressions__: dict[
         str,  # key/field
         dict[
@@ -122,7 +269,7 @@ class Entity(BaseModel):
     @classmethod
     def resolve_file_path(cls, file__: Path, /) -> Path:
         """Resolve the file path."""
-        return file__.resolve()
+        return _resolve_path(file__)
 
     @classmethod
     def model_validate_file_content(
@@ -133,15 +280,35 @@ class Entity(BaseModel):
         comments_in_file: bool,
     ) -> Self:
         """Parse the file content and extract any comments."""
-        if comments_in_file:
-            suppressions = cls.get_suppressions(file_content)
-
-            with suppress(AttributeError, IndexError, TypeError):
-                suppressions.setdefault("*", {}).update(
-                    parse_hacv_comment(file_content.ca.comment[1][0].value),  # type: ignore[attr-defined]
+        if not comments_in_file:
+            # The content has come straight from the YAML loader, and `file__` is the only
+            # field with a validator, so apply that directly and skip full validation
+            if isinstance(file__ := file_content.get("file__"), Path):
+                file_content["file__"] = cls.resolve_file_path(file__)
+
+                return cast(
+                    Self,
+                    cls.model_construct(
+                        _fields_set=set(file_content),
+                        **cast(dict[str, Any], file_content),
+                    ),
                 )
 
-            file_content["suppressions__"] = suppressions
+            return cls.model_validate(file_content)
+
+        return cls._model_validate_with_suppressions(file_content)
+
+    @classmethod
+    def _model_validate_with_suppressions(cls, file_content: JSONObj, /) -> Self:
+        """Parse the file content, including any HACV suppression comments."""
+        suppressions = cls.get_suppressions(file_content)
+
+        with suppress(AttributeError, IndexError, TypeError):
+            suppressions.setdefault("*", {}).update(
+                parse_hacv_comment(file_content.ca.comment[1][0].value),  # type: ignore[attr-defined]
+            )
+
+        file_content["suppressions__"] = suppressions
 
         return cls.model_validate(file_content)
 
@@ -200,13 +367,12 @@ class Entity(BaseModel):
             new_file (Path, optional): The new file to dump the entity to. Defaults
                 to None (i.e. the original file).
         """
+        target = new_file or self.file__
+
         try:
-            entity_yaml = HAYamlLoader.load(new_file or self.file__)
+            entity_yaml = HAYamlLoader.load(target)
         except Exception as exc:
-            raise FileIOError(
-                new_file or self.file__,
-                "load",
-            ) from exc
+            raise FileIOError(target, "load") from exc
 
         for issue in issues:
             if isinstance(issue, FixableConfigurationError):
@@ -218,41 +384,48 @@ class Entity(BaseModel):
                 )
                 issue.fixed = True
 
+        # Write to a sibling file so the final rename is atomic (same filesystem)
+        temp_file = target.with_suffix(f"{target.suffix}.hacv.{os.getpid()}.tmp")
+
         try:
-            with NamedTemporaryFile("w", delete=False) as temp_file:
-                HAYamlLoader.dump(entity_yaml, Path(temp_file.name))
-            shutil.move(temp_file.name, new_file or self.file__)
+            # Serialise in memory, so the file is written in a single call
+            buffer = StringIO()
+            HAYamlLoader.dump(entity_yaml, buffer)
+
+            temp_file.write_text(buffer.getvalue(), encoding="utf-8")
+            temp_file.replace(target)
         except Exception as exc:
-            raise FileIOError(
-                new_file or self.file__,
-                "dump",
-            ) from exc
+            temp_file.unlink(missing_ok=True)
+            raise FileIOError(target, "dump") from exc
 
     @cached_property
     def entity_dependencies(self) -> set[tuple[str, str]]:
         """Get the entities consumed by this entity."""
         deps: set[tuple[str, str]] = set()
 
-        try:
-            jproc = JProc.from_cache("entity_id_check")
-        except CacheIdNotFoundError:
-            jproc = JProc(
-                {str: entity_id_check_callback},
-                identifier="entity_id_check",
-                process_pydantic_extra_fields=True,
-            )
-
-        jproc.process(self.model_dump(), entity_ids=deps)
+        # Process a dump rather than the model itself: keys are only recorded for plain
+        # `dict`s, and once the model is assigned to, this (cached) property is moved
+        # into the extra fields, where processing it would recurse
+        ENTITY_ID_JPROC.process(self.model_dump(), entity_ids=deps)
 
         return deps
 
     def __hash__(self) -> int:
+        """Hash the entity by its (resolved) file and top-level scalar values.
+
+        Equal entities always share both, so this is consistent with `__eq__`. The
+        scalars (e.g. `id`, `alias`) distinguish entities defined in the same file,
+        without serialising the whole model on every hash. They're hashed as a set
+        because `__eq__` doesn't depend on key order.
+        """
         return hash(
-            str(self.file__)
-            + self.model_dump_json(
-                exclude_unset=True,
-                exclude_defaults=True,
-                exclude_none=True,
+            (
+                self.file__,
+                frozenset(
+                    (key, value)
+                    for key, value in (self.model_extra or {}).items()
+                    if isinstance(value, str | int | float)
+                ),
             ),
         )
 
@@ -345,8 +518,7 @@ class Secret(Tag[str]):
             )
 
         raise ValueError(  # noqa: TRY003
-            f"Secret {self.secret_id!r} not found in"
-            f" {self.FAKE_SECRETS_PATH.as_posix()!r}",
+            f"Secret {self.secret_id!r} not found in {self.FAKE_SECRETS_PATH.as_posix()!r}",
         )
 
 
@@ -357,16 +529,23 @@ class TagWithPath(Tag[ResToPath], Generic[F, ResToPath]):
 
     def __post_init__(self) -> None:
         """Post-initialisation."""
-        self.path = PurePath(self.path)
+        if not isinstance(self.path, PurePath):
+            self.path = _pure_path(str(self.path))
 
-    @JProc.callback(allow_mutation=False)
-    @staticmethod
-    def _attach_file_to_tag(
-        _value_: Tag[ResToPath],
-        file: Path,
-    ) -> None:
-        if not hasattr(_value_, "file") or _value_.file == const.NULL_PATH:
-            _value_.file = file.resolve(strict=True)
+    @classmethod
+    def construct(
+        cls,
+        loader: Any,  # XLoader type isn't importable
+        node: ScalarNode,
+        **kwargs: dict[str, Any],
+    ) -> Self:
+        """Construct the tag, attaching the file currently being loaded (if any)."""
+        tag = super().construct(loader, node, **kwargs)
+
+        if (file := LOADING_FILE.get()) is not None:
+            tag.file = file
+
+        return tag
 
     @abstractmethod
     def _add_file_content_to_data(
@@ -397,28 +576,18 @@ class TagWithPath(Tag[ResToPath], Generic[F, ResToPath]):
 
         data: ResToPath = self.RESOLVES_TO()
 
-        for file in sorted((source_file.parent / self.path).rglob(const.GLOB_PATTERN)):
+        for file in get_yaml_files(source_file.parent / self.path):
             file_content: F
             file_content, _ = load_yaml(
                 file,
                 validate_content_type=self.FILE_CONTENT_TYPE,
             )
 
-            if not isinstance(file_content, self.FILE_CONTENT_TYPE):
-                raise TypeError(  # noqa: TRY003
-                    f"File {file} contains a {type(file_content)}, but"
-                    f"`{self.TAG}` expects each file to contain a {self.FILE_CONTENT_TYPE}",
-                )
-
-            # Attach a file path to the tags for resolution later
-            # Don't need to check for missing cache ID here, that's done in `load_yaml`
-            JProc.from_cache("attach_file_to_tag").process(file_content, file=file)
-
             data = self._add_file_content_to_data(data, file, file_content)
 
         return data
 
-    @property
+    @cached_property
     def absolute_path(self) -> Path:
         """Get the resolved path for this tag."""
         return (self.file.parent / self.path).resolve()
@@ -426,7 +595,7 @@ class TagWithPath(Tag[ResToPath], Generic[F, ResToPath]):
     @property
     def entity_generator(self) -> EntityGenerator:
         """Get the entities from the tag."""
-        for file in sorted(self.absolute_path.rglob(const.GLOB_PATTERN)):
+        for file in get_yaml_files(self.absolute_path):
             yield from self._get_entities_from_file(file)
 
     def __str__(self) -> str:
@@ -508,8 +677,7 @@ class IncludeDirList(TagWithPath[JSONObj, list[JSONObj]]):
         file: Path,
         file_content: JSONObj,
     ) -> list[JSONObj]:
-        file_content["file__"] = file.resolve()
-        data.append(file_content)
+        data.append(_with_file(file_content, file))
         return data
 
     def _get_entities_from_file(
@@ -522,10 +690,8 @@ class IncludeDirList(TagWithPath[JSONObj, list[JSONObj]]):
             isolate_tags_from_files=True,
         )
 
-        file_content["file__"] = file.resolve()
-
         yield Entity.model_validate_file_content(
-            file_content,
+            _with_file(file_content, file),
             comments_in_file=comments_in_file,
         )
 
@@ -553,10 +719,7 @@ class IncludeDirMergeList(TagWithPath[list[JSONObj], list[JSONObj]]):
         file: Path,
         file_content: list[JSONObj],
     ) -> list[JSONObj]:
-        for elem in file_content:
-            elem["file__"] = file.resolve()
-
-        data.extend(file_content)
+        data.extend(_with_file(elem, file) for elem in file_content)
         return data
 
     def _get_entities_from_file(
@@ -571,10 +734,8 @@ class IncludeDirMergeList(TagWithPath[list[JSONObj], list[JSONObj]]):
         )
 
         for elem in file_content:
-            elem["file__"] = file.resolve()
-
             yield Entity.model_validate_file_content(
-                elem,
+                _with_file(elem, file),
                 comments_in_file=comments_in_file,
             )
 
@@ -602,8 +763,7 @@ class IncludeDirMergeNamed(TagWithPath[JSONObj, JSONObj]):
         file: Path,
         file_content: JSONObj,
     ) -> JSONObj:
-        file_content["file__"] = file.resolve()
-        data.update(file_content)
+        data.update(_with_file(file_content, file))
         return data
 
     def _get_entities_from_file(
@@ -615,9 +775,8 @@ class IncludeDirMergeNamed(TagWithPath[JSONObj, JSONObj]):
             validate_content_type=self.FILE_CONTENT_TYPE,
             isolate_tags_from_files=True,
         )
-        file_content["file__"] = file.resolve()
         yield Entity.model_validate_file_content(
-            file_content,
+            _with_file(file_content, file),
             comments_in_file=comments_in_file,
         )
 
@@ -645,8 +804,7 @@ class IncludeDirNamed(TagWithPath[JSONObj, JSONObj]):
         file: Path,
         file_content: JSONObj,
     ) -> JSONObj:
-        file_content["file__"] = file.resolve()
-        data[file.stem] = file_content
+        data[file.stem] = _with_file(file_content, file)
         return data
 
     def _get_entities_from_file(
@@ -658,14 +816,46 @@ class IncludeDirNamed(TagWithPath[JSONObj, JSONObj]):
             validate_content_type=self.FILE_CONTENT_TYPE,
             isolate_tags_from_files=True,
         )
-        file_content["file__"] = file.resolve()
-
         yield Entity.model_validate_file_content(
-            file_content,
+            _with_file(file_content, file),
             comments_in_file=comments_in_file,
         )
 
 
+@lru_cache(maxsize=2048)
+def _load_yaml_cached(
+    path: Path,
+    _mtime_ns: int,
+    _size: int,
+    /,
+    *,
+    isolate_tags_from_files: bool,
+) -> tuple[object, bool]:
+    """Parse a YAML file, caching the result.
+
+    The file's modification time and size are part of the cache key, so that the cached
+    content is invalidated if the file changes (e.g. when it's autofixed), even if the
+    change lands within the filesystem's timestamp granularity.
+    """
+    # Tags are attached to the file they're loaded from as they're constructed. No need
+    # for a strict resolve here, opening the file checks that it exists
+    token = LOADING_FILE.set(None if isolate_tags_from_files else _resolve_path(path))
+
+    try:
+        with path.open(encoding="utf-8") as fin:
+            raw = fin.read()
+
+        comments_in_file = "# hacv " in raw
+
+        # The round-trip loader is only needed to read suppression comments; anything
+        # else can use the (libyaml-based) safe loader
+        content = (HAYamlLoader if comments_in_file else FastYamlLoader).load(raw)
+    finally:
+        LOADING_FILE.reset(token)
+
+    return content, comments_in_file
+
+
 def load_yaml(
     path: Path,
     *,
@@ -684,17 +874,20 @@ def load_yaml(
             are not being used elsewhere (or therer aren't any tags).
 
     Returns:
-        JSONObj: The content of the YAML file as a JSON object
+        JSONObj: The content of the YAML file as a JSON object. This is shared between
+            calls for the same (unchanged) file, so must not be modified in place.
     """
-    if Secret not in HAYamlLoader.representer.yaml_representers:
-        add_custom_tags_to_loader(HAYamlLoader)
+    file_stat = path.stat()
 
-    with path.open(encoding="utf-8") as fin:
-        raw = fin.read()
+    cached_content, comments_in_file = _load_yaml_cached(
+        path,
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        isolate_tags_from_files=isolate_tags_from_files,
+    )
 
-        content = cast(F, HAYamlLoader.load(raw))
-
-        comments_in_file = "# hacv " in raw
+    # Not copied: a deep copy costs about as much as parsing the file in the first place
+    content = cast(F, cached_content)
 
     if validate_content_type is not None:
         if content is None:
@@ -709,19 +902,6 @@ def load_yaml(
                 expected_type=validate_content_type,
             )
 
-    if not isolate_tags_from_files:
-        try:
-            jproc = JProc.from_cache("attach_file_to_tag")
-        except CacheIdNotFoundError:
-            jproc = JProc(
-                {TagWithPath: TagWithPath._attach_file_to_tag},
-                identifier="attach_file_to_tag",
-                process_type_changes=True,
-                process_pydantic_extra_fields=True,
-            )
-
-        jproc.process(content, file=path)
-
     return content, comments_in_file
 
 
@@ -731,12 +911,9 @@ def add_custom_tags_to_loader(loader: YAML) -> None:
     Args:
         loader (YAML): The YAML loader to add the custom tags to.
     """
-    for tag_class in subclasses_recursive(Tag):
-        try:
-            loader.constructor.add_constructor(tag_class.TAG, tag_class.construct)
-            LOGGER.debug("Added constructor for %s", tag_class.TAG)
-        except AttributeError:  # noqa: PERF203
-            continue
+    for tag, constructor in TAG_CONSTRUCTORS.items():
+        loader.constructor.add_constructor(tag, constructor)
+        LOGGER.debug("Added constructor for %s", tag)
 
     def repr_secret(
         representer: Representer,
@@ -747,49 +924,37 @@ def add_custom_tags_to_loader(loader: YAML) -> None:
     loader.representer.add_representer(Secret, repr_secret)
 
 
-@overload
-def _validate_json_path(
-    path: str,
-    /,
-    *,
-    return_parsed: Literal[False],
-) -> JSONPathStr: ...
+JSONPATH_PARSER: Final[JsonPathParser] = JsonPathParser()
+"""Shared parser; `jsonpath_ng.parse` builds a new one (i.e. reruns yacc) for every call."""
 
+_JSON_PATH_FIELD: Final[str] = r"(?!(?:where|wherenot)\b)[A-Za-z_]\w*"
+"""A field name that jsonpath-ng parses as a field, i.e. not one of its reserved words."""
 
-@overload
-def _validate_json_path(
-    path: str,
-    /,
-    *,
-    return_parsed: Literal[True],
-) -> JSONPath: ...
+SIMPLE_JSON_PATH_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"^(?:\$\.)?{_JSON_PATH_FIELD}(?:\.{_JSON_PATH_FIELD}|\[\d+\])*$",
+    flags=re.ASCII,
+)
 
 
-@lru_cache
-def _validate_json_path(
-    path: str,
-    /,
-    *,
-    return_parsed: bool = False,
-) -> JSONPathStr | JSONPath:
+@lru_cache(maxsize=4096)
+def _validate_json_path(path: str, /) -> str:
     """Validate a JSONPath string."""
-    try:
-        parsed = parse(path)
-    except JsonPathParserError:
-        raise UserPCHConfigurationError(
-            const.ConfigurationType.VALIDATION,
-            "unknown",
-            f"Invalid JSONPath: {path}",
-        ) from None
-
-    if return_parsed:
-        return parsed
+    # Plain dotted paths (e.g. `foo.bar[0].baz`) are always valid, no need to parse them.
+    # Anything else is parsed (and cached) here, so it isn't parsed again when it's used
+    if SIMPLE_JSON_PATH_PATTERN.fullmatch(path) is None:
+        parse_jsonpath(path)
 
     return path
 
 
 JSONPathStr = Annotated[str, AfterValidator(_validate_json_path)]
 
+SIMPLE_FIELD_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"^(?:\$\.)?({_JSON_PATH_FIELD})$",
+    flags=re.ASCII,
+)
+"""A path to a single top-level field, e.g. `$.foo` or `foo`."""
+
 NO_DEFAULT: Final[object] = object()
 
 G = TypeVar("G")
@@ -835,24 +1000,45 @@ def get_json_value(
     Returns:
         Any: The value at the JSONPath expression
     """
-    json_path = parse_jsonpath(json_path_str)
+    matches: list[DatumInContext]
 
-    values: list[object] = [match.value for match in json_path.find(json_obj)]
-
-    if isinstance(json_obj, Entity):
-        json_obj = json_obj.model_dump()
+    if (
+        isinstance(json_obj, Entity)
+        and (field_match := SIMPLE_FIELD_PATTERN.fullmatch(json_path_str)) is not None
+    ):
+        # jsonpath-ng would only `getattr` the field (via `Entity.get`), so do it directly
+        value: object = getattr(json_obj, field_match.group(1), NO_DEFAULT)
+        matches = [] if value is NO_DEFAULT else [DatumInContext(value)]
+    else:
+        # Entities are searched in-place (see `Entity.get`), no need to `model_dump` them
+        matches = parse_jsonpath(json_path_str).find(json_obj)
 
-    if not values:
+    if not matches:
         if default is not NO_DEFAULT:
             return default
 
         raise JsonPathNotFoundError(json_path_str)
 
-    if valid_type is not None and not all(isinstance(value, valid_type) for value in values):
-        raise InvalidFieldTypeError(json_path_str, values, valid_type)
+    # Most paths match a single node, no need to build a list of values for them
+    if len(matches) == 1:
+        value = matches[0].value
+
+        if (
+            valid_type is not None
+            and type(value) is not valid_type
+            and not isinstance(value, valid_type)
+        ):
+            raise InvalidFieldTypeError(json_path_str, [value], valid_type)
+
+        return value
+
+    values: list[object] = [match.value for match in matches]
 
-    if len(values) == 1:
-        return values[0]
+    if valid_type is not None:
+        for value in values:
+            # Exact type check first, avoids walking the MRO in the common case
+            if type(value) is not valid_type and not isinstance(value, valid_type):
+                raise InvalidFieldTypeError(json_path_str, values, valid_type)
 
     return values
 
@@ -889,19 +1075,50 @@ def set_json_value(
     return obj
 
 
-ROOT_PREFIX_PATTERN = re.compile(r"^root(?=\W)")
+_PARSED_JSONPATHS: dict[str, JSONPath] = {}
 
 
-@lru_cache
 def parse_jsonpath(__jsonpath: str, /) -> JSONPath:
     """Parse a JSONPath expression.
 
-    This is just to cache parsed paths.
+    This is just to cache parsed paths. The set of paths is fixed by the configuration,
+    so a plain dict is used rather than an `lru_cache`.
     """
-    if ROOT_PREFIX_PATTERN.match(__jsonpath):
-        __jsonpath = ROOT_PREFIX_PATTERN.sub("$.", __jsonpath)
+    if (json_path := _PARSED_JSONPATHS.get(__jsonpath)) is not None:
+        return json_path
+
+    expression = __jsonpath
+
+    # Replace a leading `root` (followed by a non-word character) with `$.`
+    if (
+        expression.startswith("root")
+        and len(expression) > 4  # noqa: PLR2004
+        and not (expression[4].isalnum() or expression[4] == "_")
+    ):
+        expression = f"$.{expression[4:]}"
+
+    try:
+        json_path = JSONPATH_PARSER.parse(expression)
+    except JsonPathParserError:
+        raise UserPCHConfigurationError(
+            const.ConfigurationType.VALIDATION,
+            "unknown",
+            f"Invalid JSONPath: {__jsonpath}",
+        ) from None
+
+    _PARSED_JSONPATHS[__jsonpath] = json_path
+
+    return json_path
+
 
-    return _validate_json_path(__jsonpath, return_parsed=True)
+TAG_CONSTRUCTORS: Final[dict[str, Callable[..., Tag[Any]]]] = {
+    tag_class.TAG: tag_class.construct
+    for tag_class in subclasses_recursive(Tag)
+    if hasattr(tag_class, "TAG")  # Skip abstract intermediates (e.g. `TagWithPath`)
+}
+"""Mapping of YAML tag to constructor, for all custom tags."""
 
+add_custom_tags_to_loader(HAYamlLoader)
+add_custom_tags_to_loader(FastYamlLoader)
 
 __all__ = ["load_yaml"]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal
 
 from . import const
 from .exception import (
@@ -16,6 +17,49 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+FmtOpt = Literal["bold", "italic", "red", "green", "amber", "blue", "cyan"]
+
+ANSI_CODES: Final[dict[FmtOpt, str]] = {
+    "bold": "\033[1m",
+    "italic": "\033[3m",
+    "red": "\033[31m",
+    "green": "\033[32m",
+    "amber": "\033[33m",
+    "blue": "\033[34m",
+    "cyan": "\033[36m",
+}
+ANSI_RESET: Final[str] = "\033[0m"
+
+
+@lru_cache
+def _ansi_prefix(fmt_opts: tuple[FmtOpt, ...], /) -> str:
+    """Get the combined escape sequence for a set of formatting options."""
+    # Each option is prepended in turn, so the last option ends up first
+    return "".join(ANSI_CODES[fmt_opt] for fmt_opt in reversed(fmt_opts))
+
+
+def fmt_str(v: Any, /, *fmt_opts: FmtOpt) -> str:
+    """Format a value with ANSI escape sequences, resetting the formatting after it."""
+    return f"{_ansi_prefix(fmt_opts)}{v!s}{ANSI_RESET}"
+
+
+FIXABLE_INDICATOR: Final[str] = f"[{fmt_str('*', 'cyan')}]"
+
+
+def _summary_line(*, total: int, fixed: int, fixable: int) -> str:
+    """Build the summary line for the output; it only depends on the issue counts."""
+    total_colour: FmtOpt = "amber" if (total - fixed) < 10 else "red"  # noqa: PLR2004
+
+    summary_line = fmt_str(f"Found {fmt_str(total, total_colour)} issues", "bold")
+
+    if fixed:
+        summary_line += f", fixed {fmt_str(fixed, 'bold', 'green')} 🎉"
+
+    if fixable:
+        summary_line += f"\n{FIXABLE_INDICATOR} {fmt_str(fixable, 'bold', 'green')} fixable with the `--fix` option"  # noqa: E501
+
+    return summary_line
+
 
 def format_output(
     data: dict[str, dict[Path, list[InvalidConfigurationError]]],
@@ -32,35 +76,7 @@ def format_output(
     Raises:
         TypeError: If `data` is not a dict or list
     """
-
-    def fmt_str(
-        v: Any,
-        /,
-        *fmt_opts: Literal["bold", "italic", "red", "green", "amber", "blue", "cyan"],
-    ) -> str:
-        s = str(v)
-        codes = {
-            "bold": "\033[1m",
-            "italic": "\033[3m",
-            "red": "\033[31m",
-            "green": "\033[32m",
-            "amber": "\033[33m",
-            "blue": "\033[34m",
-            "cyan": "\033[36m",
-            "reset": "\033[0m",
-        }
-
-        for fmt_opt in fmt_opts:
-            s = f"{codes[fmt_opt]}{s!s}"
-
-        if s.endswith(codes["reset"]):
-            return s
-
-        return f"{s}{codes['reset']}"
-
-    fixable_indicator = f"[{fmt_str('*', 'cyan')}]"
-
-    output_lines = []
+    package_issue_lines: dict[str, list[str]] = {}
     issue_count = {
         "fixed": 0,
         "fixable": 0,
@@ -72,9 +88,22 @@ def format_output(
         if not issues:
             continue
 
-        package_lines = []
+        package_lines: list[str] = []
 
         for path, issue_list in issues.items():
+            if not issue_list:
+                continue
+
+            if all(exc.fixed for exc in issue_list):
+                # Nothing to output for this file, just count the fixes
+                issue_count["fixed"] += len(issue_list)
+                issue_count["total"] += len(issue_list)
+                continue
+
+            path_fmt = (
+                f"{fmt_str(path.relative_to(const.REPO_PATH), 'bold')}{fmt_str(':', 'cyan')}"
+            )
+
             for exc in issue_list:
                 if exc.fixed:
                     issue_count["fixed"] += 1
@@ -85,20 +114,11 @@ def format_output(
 
                 if isinstance(exc, FixableConfigurationError):
                     issue_count["fixable"] += 1
-                    exc_typ = f"{fmt_str(exc_typ, 'amber', 'bold')} {fixable_indicator}"
+                    exc_typ = f"{fmt_str(exc_typ, 'amber', 'bold')} {FIXABLE_INDICATOR}"
                 else:
                     exc_typ = fmt_str(exc_typ, "red", "bold")
 
-                issue_line = " ".join(
-                    (
-                        fmt_str(path.relative_to(const.REPO_PATH), "bold")
-                        + fmt_str(":", "cyan"),
-                        exc_typ,
-                        exc.fmt_msg,
-                    ),
-                )
-
-                package_lines.append((pkg_name, issue_line))
+                package_lines.append(f"{path_fmt} {exc_typ} {exc.fmt_msg}")
                 issue_count["total"] += 1
 
         if package_lines:
@@ -106,39 +126,23 @@ def format_output(
                 name_pad,
                 len(pkg_name) + 1,
             )
-            output_lines.extend(package_lines)
-
-    summary_line = fmt_str(
-        " ".join(
-            (
-                "Found",
-                fmt_str(
-                    str(issue_count["total"]),
-                    (
-                        "amber"
-                        if (issue_count["total"] - issue_count["fixed"]) < 10  # noqa: PLR2004
-                        else "red"
-                    ),
-                ),
-                "issues",
-            ),
-        ),
-        "bold",
+            package_issue_lines[pkg_name] = package_lines
+
+    summary_line = _summary_line(
+        total=issue_count["total"],
+        fixed=issue_count["fixed"],
+        fixable=issue_count["fixable"],
     )
 
-    if issue_count["fixed"]:
-        summary_line += f", fixed {fmt_str(issue_count['fixed'], 'bold', 'green')} 🎉"
+    output_lines: list[str] = []
 
-    if issue_count["fixable"]:
-        summary_line += f"\n{fixable_indicator} {fmt_str(issue_count['fixable'], 'bold', 'green')} fixable with the `--fix` option"  # noqa: E501
+    for pkg_name, package_lines in package_issue_lines.items():
+        # The padded package name is the same for all of its issues, only format it once
+        pkg_name_fmt = fmt_str(f"{pkg_name:<{name_pad}}", "bold", "italic", "blue")
 
-    return "\n" + (
-        "\n".join(
-            f"{fmt_str(f'{pkg_name:<{name_pad}}', 'bold', 'italic', 'blue')} {issue_line}"
-            for pkg_name, issue_line in output_lines
-        )
-        + f"\n\n{summary_line}\n"
-    )
+        output_lines.extend(f"{pkg_name_fmt} {issue_line}" for issue_line in package_lines)
+
+    return "\n" + "\n".join(output_lines) + f"\n\n{summary_line}\n"
 
 
 __all__ = ["format_output"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 from collections import defaultdict
+from copy import deepcopy
 from typing import TYPE_CHECKING, Final, Literal, TypedDict
 
 from jinja2.defaults import (
@@ -14,7 +15,6 @@ from jinja2.defaults import (
     VARIABLE_END_STRING,
     VARIABLE_START_STRING,
 )
-from wg_utilities.helpers.mixin.instance_cache import CacheIdNotFoundError
 from wg_utilities.helpers.processor import JProc
 
 from home_assistant_config_validator.models import Package
@@ -24,12 +24,12 @@ from home_assistant_config_validator.utils import (
     Secret,
     args,
     const,
-    entity_id_check_callback,
     exc,
     format_output,
     load_yaml,
 )
 from home_assistant_config_validator.utils.exception import InvalidEntityConsumedError
+from home_assistant_config_validator.utils.ha_yaml_loader import is_entity_id
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 VAR_TEMPLATE_BLOCK_START_STRING: Final[Literal["[["]] = "[["
 VAR_TEMPLATE_BLOCK_END_STRING: Final[Literal["]]"]] = "]]"
 
+ENTITY_KEYS: Final[frozenset[str]] = frozenset({"entity", "entity_id", "service"})
+
 
 class Card(TypedDict):
     """Basic type definition for a single Lovelace card."""
@@ -86,27 +88,74 @@ def check_known_entity_usages(
     This only applies to the packages which are solely defined in YAML files; any
     packages which have entities that can be defined through the GUI are not checked.
     """
-    entity_ids: set[tuple[str, str]] = set()
-
-    try:
-        jproc = JProc.from_cache("entity_id_check")
-    except CacheIdNotFoundError:
-        jproc = JProc(
-            {str: entity_id_check_callback},
-            identifier="entity_id_check",
-            process_pydantic_extra_fields=True,
-        )
-
-    jproc.process(config, entity_ids=entity_ids)
-
-    while entity_ids:
-        dict_key, entity_id = entity_ids.pop()
+    known_entity_ids = ValidationConfig.KNOWN_ENTITY_IDS
+    unknown_entity_ids: set[tuple[str, str]] = set()
+
+    # Only strings directly under one of the entity keys are checked, so there's no need
+    # to run the entity ID check over every string in the config
+    stack: list[object] = [config]
+
+    while stack:
+        node = stack.pop()
+
+        if isinstance(node, dict):
+            for dict_key, value in node.items():
+                if isinstance(value, str):
+                    if (
+                        dict_key in ENTITY_KEYS
+                        and value not in known_entity_ids
+                        and is_entity_id(value)
+                    ):
+                        unknown_entity_ids.add((dict_key, value))
+                elif isinstance(value, dict | list):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, dict | list))
+
+    for dict_key, entity_id in unknown_entity_ids:
+        all_issues[file].append(InvalidEntityConsumedError(dict_key, entity_id))
+
+
+@JProc.callback(allow_mutation=False)
+def _validate_decluttering_template_cb(
+    _value_: str,
+    all_issues: dict[Path, list[exc.InvalidConfigurationError]],
+    decluttering_templates: Include | dict[str, DeclutteringTemplate],
+    file: Path,
+) -> None:
+    if _value_ not in decluttering_templates:
+        all_issues[file].append(exc.DeclutteringTemplateNotFoundError(_value_))
 
-        if dict_key not in ("entity", "entity_id", "service"):
-            continue
 
-        if entity_id not in ValidationConfig.KNOWN_ENTITY_IDS:
-            all_issues[file].append(InvalidEntityConsumedError(dict_key, entity_id))
+DECLUTTERING_TEMPLATES_JPROC: Final[JProc] = JProc(
+    {
+        str: JProc.cb(
+            _validate_decluttering_template_cb,
+            lambda item, loc: (
+                loc == "template"
+                # False positives from actual templates
+                and not item.lstrip().startswith(
+                    (
+                        BLOCK_START_STRING,
+                        COMMENT_START_STRING,
+                        VARIABLE_START_STRING,
+                        VAR_TEMPLATE_BLOCK_START_STRING,
+                    ),
+                )
+                and not item.rstrip().endswith(
+                    (
+                        BLOCK_END_STRING,
+                        COMMENT_END_STRING,
+                        VARIABLE_END_STRING,
+                        VAR_TEMPLATE_BLOCK_END_STRING,
+                    ),
+                )
+            ),
+        ),
+    },
+    identifier="validate_decluttering_templates",
+    process_pydantic_extra_fields=True,
+)
 
 
 def validate_decluttering_templates(
@@ -117,51 +166,12 @@ def validate_decluttering_templates(
     file: Path,
 ) -> None:
     """Validate that all referenced decluttering templates are defined."""
-    decluttering_templates: Include | dict[str, DeclutteringTemplate] = lovelace_config[
-        "decluttering_templates"
-    ]
-
-    @JProc.callback(allow_mutation=False)
-    def _val_decluttering_templates(
-        _value_: str,
-    ) -> None:
-        all_issues[file].append(exc.DeclutteringTemplateNotFoundError(_value_))
-
-    try:
-        jproc = JProc.from_cache("validate_decluttering_templates")
-    except CacheIdNotFoundError:
-        jproc = JProc(
-            {
-                str: JProc.cb(
-                    _val_decluttering_templates,
-                    lambda item, loc: (
-                        loc == "template"
-                        # False positives from actual templates
-                        and not item.lstrip().startswith(
-                            (
-                                BLOCK_START_STRING,
-                                COMMENT_START_STRING,
-                                VARIABLE_START_STRING,
-                                VAR_TEMPLATE_BLOCK_START_STRING,
-                            ),
-                        )
-                        and not item.rstrip().endswith(
-                            (
-                                BLOCK_END_STRING,
-                                COMMENT_END_STRING,
-                                VARIABLE_END_STRING,
-                                VAR_TEMPLATE_BLOCK_END_STRING,
-                            ),
-                        )
-                        and item not in decluttering_templates
-                    ),
-                ),
-            },
-            identifier="validate_decluttering_templates",
-            process_pydantic_extra_fields=True,
-        )
-
-    jproc.process(config)
+    DECLUTTERING_TEMPLATES_JPROC.process(
+        config,
+        all_issues=all_issues,
+        decluttering_templates=lovelace_config["decluttering_templates"],
+        file=file,
+    )
 
 
 @JProc.callback()
@@ -170,7 +180,16 @@ def _get_unused_files_cb(
     included_files: list[Path],
 ) -> dict[str, object]:
     included_files.append(_value_.absolute_path)
-    return _value_.resolve()
+
+    # The loaded content is shared, and this processor replaces tags in place
+    return deepcopy(_value_.resolve())
+
+
+UNUSED_FILES_JPROC: Final[JProc] = JProc(
+    {Include: _get_unused_files_cb},
+    identifier="get_unused_files",
+    process_pydantic_extra_fields=True,
+)
 
 
 def get_unused_files(
@@ -187,17 +206,8 @@ def get_unused_files(
 
     included_files: list[Path] = []
 
-    try:
-        jproc = JProc.from_cache("get_unused_files")
-    except CacheIdNotFoundError:
-        jproc = JProc(
-            {Include: _get_unused_files_cb},
-            identifier="get_unused_files",
-            process_pydantic_extra_fields=True,
-        )
-
-    jproc.process(lovelace_config, included_files=included_files)
-    jproc.process(package_config, included_files=included_files)
+    UNUSED_FILES_JPROC.process(lovelace_config, included_files=included_files)
+    UNUSED_FILES_JPROC.process(package_config, included_files=included_files)
 
     dashboards = []
     db_config: dict[str, str]
@@ -205,8 +215,9 @@ def get_unused_files(
         dashboard_file = const.REPO_PATH.joinpath(db_config["filename"]).resolve()
         included_files.append(dashboard_file)
         db_yaml, _ = load_yaml(dashboard_file, validate_content_type=dict[str, object])
+        db_yaml = deepcopy(db_yaml)
 
-        jproc.process(db_yaml, included_files=included_files)
+        UNUSED_FILES_JPROC.process(db_yaml, included_files=included_files)
 
         dashboards.append(
             (
@@ -230,12 +241,14 @@ def main() -> bool:
     """Validate all entities."""
     args.parse_arguments(validate_all_packages_override=False)
     llc, _ = load_yaml(const.LOVELACE_ROOT_FILE)
+    llc = deepcopy(llc)  # Includes are resolved in place by `get_unused_files`
 
     pkg = Package.by_name("lovelace")
     ValidationConfig.get_for_package(pkg)
 
     lovelace_config = LovelaceConfig(**llc)  # type: ignore[typeddict-item]
     package_config, _ = load_yaml(pkg.root_file, validate_content_type=dict[str, object])
+    package_config = deepcopy(package_config)
 
     all_issues: defaultdict[Path, list[exc.InvalidConfigurationError]] = defaultdict(list)
 
@@ -0,0 +1,53 @@
+"""Unit tests for the configuration models and helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from home_assistant_config_validator.models.config.base import replace_non_alphanumeric
+from home_assistant_config_validator.models.config.validation import (
+    Case,
+    ShouldMatchFilepathItem,
+)
+
+
+@pytest.mark.parametrize(
+    ("string", "ignore_chars", "replace_with", "expected"),
+    [
+        ("Living Room Light", "", "_", "living_room_light"),
+        ("  Leading & trailing!  ", "", "_", "leading_trailing"),
+        ("__double__under__", "", "_", "double_under"),
+        ("Café Lights", "", "_", "caf_lights"),
+        ("Kitchen -- Main (Ceiling)", "", "-", "kitchen-main-ceiling"),
+        ("Front  Door", "", " ", "front door"),
+        ("CamelCase Value", "", "", "camelcasevalue"),
+        ("a.b/c d", ["/"], "", "ab/cd"),
+        ("some-file_name", "-", "", "some-filename"),
+    ],
+)
+def test_replace_non_alphanumeric(
+    string: str,
+    ignore_chars: str | list[str],
+    replace_with: str,
+    expected: str,
+) -> None:
+    """Test that strings are normalised as expected."""
+    assert (
+        replace_non_alphanumeric(string, ignore_chars, replace_with=replace_with) == expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("case", "expected"),
+    [
+        (None, "/"),
+        (Case.KEBAB, "/-"),
+        (Case.SNAKE, "/_"),
+        (Case.PASCAL, "/"),
+    ],
+)
+def test_normalisation_ignore_chars(case: Case | None, expected: str) -> None:
+    """Test that the separator (and case-specific character) are kept."""
+    item = ShouldMatchFilepathItem(case=case, separator="/")
+
+    assert item.normalisation_ignore_chars == expected
@@ -0,0 +1,203 @@
+"""Unit tests for the YAML loading utilities."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path, PurePath
+
+import pytest
+from ruamel.yaml import YAML
+from ruamel.yaml.constructor import ConstructorError
+
+from home_assistant_config_validator.utils import Entity, exc, load_yaml
+from home_assistant_config_validator.utils.ha_yaml_loader import (
+    IncludeDirList,
+    Secret,
+    _validate_json_path,
+    get_yaml_files,
+)
+
+AUTOMATION_YAML = """
+alias: Kitchen Lights
+trigger:
+  - platform: state
+    entity_id: binary_sensor.kitchen_motion
+    to: "on"
+action:
+  - service: light.turn_on
+    target:
+      entity_id: light.kitchen  # hacv disable: InvalidEntityConsumed
+"""
+
+
+def _load_entity(tmp_path: Path) -> Entity:
+    """Load the automation above through an `!include_dir_list` tag."""
+    if not (entity_file := tmp_path / "automations" / "kitchen_lights.yaml").exists():
+        entity_file.parent.mkdir()
+        entity_file.write_text(AUTOMATION_YAML)
+
+    tag = IncludeDirList(path=PurePath("automations"))
+    tag.file = tmp_path / "configuration.yaml"
+
+    (entity,) = tag.entity_generator
+
+    return entity
+
+
+def test_entity_dependencies_are_keyed_by_field(tmp_path: Path) -> None:
+    """Test that dependencies are keyed by the field they're consumed in."""
+    entity = _load_entity(tmp_path)
+
+    assert entity.entity_dependencies == {
+        ("entity_id", "binary_sensor.kitchen_motion"),
+        ("entity_id", "light.kitchen"),
+    }
+
+
+def test_entity_dependency_keys_match_suppressions(tmp_path: Path) -> None:
+    """Test that suppression comments can be looked up with the dependency keys."""
+    entity = _load_entity(tmp_path)
+
+    suppressed = {
+        entity_id
+        for key, entity_id in entity.entity_dependencies
+        if exc.InvalidEntityConsumedError.SUPPRESSION_COMMENT
+        in entity.suppressions__.get(key, ())
+    }
+
+    assert suppressed == {"binary_sensor.kitchen_motion", "light.kitchen"}
+
+
+def test_entity_dependencies_after_assignment(tmp_path: Path) -> None:
+    """Test that dependencies can be recalculated after the entity is assigned to.
+
+    Assignment (with `validate_assignment`) moves the cached value into the model's
+    extra fields, so the property is evaluated again on the next access.
+    """
+    entity = _load_entity(tmp_path)
+    dependencies = entity.entity_dependencies
+
+    entity.jinja_consumed_entities__ |= {("value_template", "sensor.kitchen_temperature")}
+
+    assert entity.entity_dependencies == dependencies
+
+
+def test_entity_without_comments_matches_validated_entity(tmp_path: Path) -> None:
+    """Test that the unvalidated fast path builds the same entity as full validation."""
+    file_content = {
+        "file__": tmp_path / "automations" / ".." / "kitchen_lights.yaml",
+        "alias": "Kitchen Lights",
+        "trigger": [{"platform": "state", "entity_id": "binary_sensor.kitchen_motion"}],
+    }
+
+    constructed = Entity.model_validate_file_content(
+        dict(file_content),
+        comments_in_file=False,
+    )
+    validated = Entity.model_validate(dict(file_content))
+
+    assert constructed == validated
+    assert constructed.file__ == tmp_path.resolve() / "kitchen_lights.yaml"
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.suppressions__ == {}
+    assert constructed.jinja_consumed_entities__ == set()
+
+
+def test_get_yaml_files_matches_rglob(tmp_path: Path) -> None:
+    """Test that the YAML file listing is the same as a sorted `rglob`."""
+    for relative_path in ("b.yaml", "a/c.yaml", "a/b/a.yaml", "a/notes.txt", "c/d.yaml"):
+        file = tmp_path / relative_path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.touch()
+
+    assert get_yaml_files(tmp_path) == tuple(sorted(tmp_path.rglob("*.yaml")))
+    assert get_yaml_files(tmp_path / "missing") == ()
+    assert get_yaml_files(tmp_path / "b.yaml") == ()
+
+
+def test_get_yaml_files_sees_changes_in_subdirectories(tmp_path: Path) -> None:
+    """Test that adding a file to a subdirectory invalidates the cached listing."""
+    sub_dir = tmp_path / "sub"
+    sub_dir.mkdir()
+    sub_dir.joinpath("a.yaml").touch()
+
+    # Backdate the directories, so any change is guaranteed to update their mtimes
+    for directory in (tmp_path, sub_dir):
+        os.utime(directory, ns=(0, 0))
+
+    assert get_yaml_files(tmp_path) == (sub_dir / "a.yaml",)
+
+    sub_dir.joinpath("b.yaml").touch()
+
+    assert get_yaml_files(tmp_path) == (sub_dir / "a.yaml", sub_dir / "b.yaml")
+
+
+def test_loading_entities_does_not_modify_loaded_content(tmp_path: Path) -> None:
+    """Test that the (shared) content returned by `load_yaml` isn't modified in place."""
+    entity = _load_entity(tmp_path)
+    content, comments_in_file = load_yaml(entity.file__)
+
+    assert comments_in_file
+    assert "file__" not in content
+    assert "suppressions__" not in content
+    assert _load_entity(tmp_path) == entity
+
+
+def test_entity_hash(tmp_path: Path) -> None:
+    """Test that entities from the same file hash differently, unless they're equal."""
+    file = tmp_path / "automations.yaml"
+
+    kitchen, kitchen_again, hallway = (
+        Entity.model_validate({"file__": file, "id": entity_id, "trigger": []})
+        for entity_id in ("kitchen", "kitchen", "hallway")
+    )
+
+    assert kitchen == kitchen_again
+    assert hash(kitchen) == hash(kitchen_again)
+    assert hash(kitchen) != hash(hallway)
+    assert len({kitchen, kitchen_again, hallway}) == 2  # noqa: PLR2004
+
+
+def test_entity_hash_ignores_key_order(tmp_path: Path) -> None:
+    """Test that equal entities with differently-ordered keys hash the same."""
+    file = tmp_path / "automations.yaml"
+
+    entity = Entity.model_validate({"file__": file, "id": "kitchen", "alias": "Kitchen"})
+    reordered = Entity.model_validate(
+        {"file__": file, "alias": "Kitchen", "id": "kitchen"},
+    )
+
+    assert entity == reordered
+    assert hash(entity) == hash(reordered)
+
+
+def test_custom_tags_do_not_leak_into_other_safe_loaders(tmp_path: Path) -> None:
+    """Test that only the package's own loaders construct the custom tags."""
+    (secrets_file := tmp_path / "secrets.yaml").write_text("api_key: !secret api_key\n")
+
+    content, _ = load_yaml(secrets_file, isolate_tags_from_files=True)
+
+    assert isinstance(content["api_key"], Secret)
+
+    with pytest.raises(ConstructorError):
+        YAML(typ="safe").load(secrets_file.read_text())
+
+
+@pytest.mark.parametrize(
+    ("path", "valid"),
+    [
+        ("foo.bar[0].baz", True),
+        ("$.whereabouts", True),
+        ("where", False),
+        ("foo.where", False),
+        ("foo.wherenot.bar", False),
+        ("$.foo[0].where", False),
+    ],
+)
+def test_validate_json_path_reserved_words(path: str, *, valid: bool) -> None:
+    """Test that simple-looking paths using jsonpath-ng's reserved words are rejected."""
+    if valid:
+        assert _validate_json_path(path) == path
+    else:
+        with pytest.raises(exc.UserPCHConfigurationError):
+            _validate_json_path(path)